@@ -26,6 +26,10 @@ use std::{
 };
 use tokio::try_join;
 
+/// Upper bound for the delay between matcher iterations while the node keeps
+/// failing to return state.
+const MAX_ERROR_BACKOFF: Duration = Duration::from_secs(300);
+
 pub struct BoxIdGate {
     current_ids: HashSet<BoxId>,
 }
@@ -198,9 +202,10 @@ async fn matcher_loop(
     reward_script: &ErgoTree,
 ) {
     let mut box_id_gate = BoxIdGate::new();
+    let mut consecutive_errors: u32 = 0;
 
     loop {
-        tokio::time::sleep(matcher_interval).await;
+        tokio::time::sleep(matcher_delay(matcher_interval, consecutive_errors)).await;
 
         let state_result = try_join!(
             node_client.get_scan_unspent(scan_config.multigrid_scan_id),
@@ -211,11 +216,14 @@ async fn matcher_loop(
         let (grid_orders, n2t_pools, mempool_txs) = match state_result {
             Ok(state) => state,
             Err(e) => {
+                consecutive_errors = consecutive_errors.saturating_add(1);
                 println!("Error getting state: {}", e);
                 continue;
             }
         };
 
+        consecutive_errors = 0;
+
         let overlay: MempoolOverlay = mempool_txs.into_iter().collect();
 
         let grid_orders: Vec<TrackedBox<MultiGridOrder>> = grid_orders
@@ -266,6 +274,16 @@ async fn matcher_loop(
     }
 }
 
+/// Returns the delay before the next matcher iteration, doubling the interval
+/// for every consecutive failure to get state up to `MAX_ERROR_BACKOFF`.
+fn matcher_delay(matcher_interval: Duration, consecutive_errors: u32) -> Duration {
+    let factor = 1u32.checked_shl(consecutive_errors).unwrap_or(u32::MAX);
+
+    matcher_interval
+        .saturating_mul(factor)
+        .min(MAX_ERROR_BACKOFF.max(matcher_interval))
+}
+
 async fn try_fill_orders(
     node_client: &NodeClient,
     reward_script: &ErgoTree,